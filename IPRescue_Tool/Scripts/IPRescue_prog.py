@@ -10,6 +10,9 @@ It includes functions for checking selections, applying paint modes, and creatin
 Functions:
 ----------
 - selection_check(): Checks the current selection in Maya and returns the geometry, its type, and selected vertices.
+- suspended_viewport(): Context manager that suspends viewport refresh while deformers are created.
+- undo_chunk(): Context manager that wraps its body in a single undo chunk.
+- quiet_commands(): Context manager that turns off command echo and auto-key, restoring them afterwards.
 - paint_mode(geo, vtx, smooth_value, deformer_type, deformer_name): Applies paint mode to the specified geometry and vertices.
 - deltaMush(geo, vtx, iteration_value): Creates a deltaMush deformer on the specified geometry with the given iteration value.
 - texture_deformer(geo, vtx, offset, strength_value, name): Creates a texture deformer on the specified geometry with the given offset and strength value.
@@ -35,81 +38,219 @@ March 5, 2025
 """
 
 from __future__ import absolute_import, division, print_function, unicode_literals
+import contextlib
+import re
 import maya.cmds as mc
 import maya.mel as mel
 import maya.api.OpenMaya as om
 
+# Component part of a selected item: vertex, edge or face
+_COMPONENT_RE = re.compile(r'\.(vtx|e|f)\[')
+
+# Matches 'mesh.vtx[i]' as well as the compact 'mesh.vtx[a:b]' form
+_VTX_RE = re.compile(r'^(.+)\.vtx\[(\d+)(?::(\d+))?\]$')
+
+@contextlib.contextmanager
+def suspended_viewport():
+    suspend_state = mc.refresh(q=True, suspend=True)
+    mc.refresh(suspend=True)
+    try:
+        yield
+    finally:
+        mc.refresh(suspend=suspend_state)
+
+@contextlib.contextmanager
+def undo_chunk():
+    mc.undoInfo(openChunk=True)
+    try:
+        yield
+    finally:
+        mc.undoInfo(closeChunk=True)
+
+@contextlib.contextmanager
+def quiet_commands():
+    echo_state = mc.commandEcho(q=True, state=True)
+    autokey_state = mc.autoKeyframe(q=True, state=True)
+
+    mc.commandEcho(state=False)
+    mc.autoKeyframe(state=False)
+    try:
+        yield
+    finally:
+        mc.commandEcho(state=echo_state)
+        mc.autoKeyframe(state=autokey_state)
+
+def _vtx_sort_key(item):
+    # Order vertices by mesh, then by index rather than by name
+    match = _VTX_RE.match(item)
+    if not match:
+        return item, -1
+
+    return match.group(1), int(match.group(2))
+
 def selection_check():
-    geo = mc.ls(sl=True, o=True)[0]
     geo_type = mc.ls(sl=True, fl=True)
-    vtxSel = []
 
-    if len(geo_type) > 0:
-        for item in geo_type:
-            if '.vtx' in item:
-                vtxSel.append(item)
+    geo = mc.ls(sl=True, o=True)[0]
+
+    # Split the selection by component type, one regex search per item
+    components = {'vtx': [], 'e': [], 'f': []}
+    for item in geo_type:
+        match = _COMPONENT_RE.search(item)
+        if match:
+            components[match.group(1)].append(item)
+
+    edges, faces = components['e'], components['f']
+    vtxSel = set(components['vtx'])
 
-            # convert face\edge into vertex
-            elif '.e' in item:
-                eConv = mc.polyListComponentConversion(geo_type, fe=1, tv=1)
-                for i in eConv:
-                    vtxSel.append(i)
+    # convert face\edge into vertex, one call per component type
+    if edges:
+        vtxSel.update(mc.polyListComponentConversion(edges, fe=1, tv=1) or [])
+    if faces:
+        vtxSel.update(mc.polyListComponentConversion(faces, ff=1, tv=1) or [])
 
-            elif '.f' in item:
-                fConv = mc.polyListComponentConversion(geo_type, ff=1, tv=1)
-                for i in fConv:
-                    vtxSel.append(i)
+    vtxSel = sorted(vtxSel, key=_vtx_sort_key)
 
     return geo, geo_type, vtxSel
 
+def _vtx_indices(vtx_list):
+    ''' Group vertex names by mesh, returning {mesh: sorted vertex indices}.'''
+    groups = {}
+    for item in vtx_list:
+        match = _VTX_RE.match(item)
+        if not match:
+            continue
+
+        mesh, start, end = match.groups()
+        start = int(start)
+        end = int(end) if end else start
+        groups.setdefault(mesh, set()).update(range(start, end + 1))
+
+    return {mesh: sorted(ids) for mesh, ids in groups.items()}
+
+def _mesh_dag(mesh):
+    ''' Return the MDagPath of the mesh shape for a mesh or transform name.'''
+    dag = om.MSelectionList().add(mesh).getDagPath(0)
+    if dag.apiType() == om.MFn.kTransform:
+        dag.extendToShape()
+
+    return dag
+
+def _add_vertices(selection, dag, ids):
+    comp_fn = om.MFnSingleIndexedComponent()
+    components = comp_fn.create(om.MFn.kMeshVertComponent)
+    comp_fn.addElements(list(ids))
+    selection.add((dag, components))
+
+def _vertex_selection(vtx_list):
+    ''' Build an MSelectionList holding the given vertices, so they can be selected without mc.select parsing every name.'''
+    selection = om.MSelectionList()
+    for mesh, ids in _vtx_indices(vtx_list).items():
+        _add_vertices(selection, _mesh_dag(mesh), ids)
+
+    return selection
+
+def _face_neighbors(dag, mesh_fn, vertices):
+    ''' Map each of the given vertices to the vertices sharing a face with it, like the grow selection does.
+    Only the faces touching the given vertices are read, so the cost follows the selection, not the mesh.'''
+    vtx_it = om.MItMeshVertex(dag)
+    faces = set()
+    for v in vertices:
+        vtx_it.setIndex(v)
+        faces.update(vtx_it.getConnectedFaces())
+
+    # Single pass over that subset of faces
+    neighbors = {}
+    for face_id in faces:
+        face = list(mesh_fn.getPolygonVertices(face_id))
+        for v in face:
+            if v in vertices:
+                neighbors.setdefault(v, set()).update(face)
+
+    return neighbors
+
+def _smooth_region(vtx_list, rings):
+    ''' Return an MSelectionList with every vertex outside vtx_list, grown by the given number of rings into it.
+    Same result as invertSelection followed by GrowPolygonSelectionRegion repeated rings times.'''
+    selection = om.MSelectionList()
+    for mesh, ids in _vtx_indices(vtx_list).items():
+        dag = _mesh_dag(mesh)
+        mesh_fn = om.MFnMesh(dag)
+        inside = set(ids)
+        neighbors = _face_neighbors(dag, mesh_fn, inside)
+
+        # First ring is the border of the selection, then walk inwards
+        ring = set(i for i in inside if not neighbors.get(i, set()) <= inside) if rings > 0 else set()
+        grown = set(ring)
+        for _ in range(rings - 1):
+            ring = set(n for i in ring for n in neighbors[i] if n in inside and n not in grown)
+            if not ring:
+                break
+            grown |= ring
+
+        # Whole mesh minus the untouched inside, without listing every vertex index
+        comp_fn = om.MFnSingleIndexedComponent()
+        complete = comp_fn.create(om.MFn.kMeshVertComponent)
+        comp_fn.setCompleteData(mesh_fn.numVertices)
+        selection.add((dag, complete))
+
+        untouched = inside - grown
+        if untouched:
+            comp_fn = om.MFnSingleIndexedComponent()
+            removed = comp_fn.create(om.MFn.kMeshVertComponent)
+            comp_fn.addElements(list(untouched))
+            selection.merge(dag, removed, om.MSelectionList.kRemoveFromList)
+
+    return selection
+
 def paint_mode(geo, vtx, smooth_value, deformer_type, deformer_name):
     try:
         mc.select(geo, af=1)
         mc.percent(deformer_name, v=0)
-        mel.eval('ArtPaintBlendShapeWeightsTool')
+        mc.ArtPaintBlendShapeWeightsTool()
         mel.eval('artSetToolAndSelectAttr( "artAttrCtx", "{}.{}.weights" );'.format(deformer_type, deformer_name))
 
+        # Paint context set by the tool above, queried once
+        ctx = mc.currentCtx()
+
         if vtx:
-            mc.select(vtx)
-            mel.eval('artAttrPaintOperation artAttrCtx Replace;')
-            mel.eval('artAttrCtx -e -value 1 `currentCtx`;')
-            mel.eval('artAttrCtx -e -clear `currentCtx`;')
-
-            mc.select(vtx)
-            mel.eval('invertSelection;')
-            for _ in range(smooth_value):
-                mc.GrowPolygonSelectionRegion()
-
-            mel.eval('artAttrPaintOperation artAttrCtx Smooth;')
-            mel.eval('artAttrCtx -e -value 1 `currentCtx`;')
-            for _ in range(smooth_value):
-                mel.eval('artAttrCtx -e -clear `currentCtx`;')
-
-            mc.select(vtx)
+            vtx_selection = _vertex_selection(vtx)
+
+            om.MGlobal.setActiveSelectionList(vtx_selection)
+            mc.artAttrCtx(ctx, e=True, selectedattroper='absolute', value=1)
+            mc.artAttrCtx(ctx, e=True, clear=True)
+
+            # Nothing to smooth, the selection is already the painted area
+            if smooth_value > 0:
+                # Inverted selection grown into the painted area, in a single selection
+                om.MGlobal.setActiveSelectionList(_smooth_region(vtx, smooth_value))
+
+                mc.artAttrCtx(ctx, e=True, selectedattroper='smooth', value=1)
+                for _ in range(smooth_value):
+                    mc.artAttrCtx(ctx, e=True, clear=True)
+
+                om.MGlobal.setActiveSelectionList(vtx_selection)
     except Exception as e:
         print('Error in paint_mode: {}'.format(e))
 
 def deltaMush(geo, vtx, iteration_value):
-    name_suffix = 'superDelta'
-
+    # Component selections give the mesh shape, the deformer goes on its transform
     if mc.objectType(geo) == 'mesh':
         geo_transform = mc.listRelatives(geo, parent=True)[0]
 
         delta_mush_deformer = mc.deltaMush(
-            geo_transform, name = '{}_{}'.format(geo_transform, name_suffix), ss=1, si=iteration_value
+            geo_transform, name=f'{geo_transform}_superDelta', ss=1, si=iteration_value
         )[0]
 
-        mc.setAttr('{}.displacement'.format(delta_mush_deformer), 0)
+        mc.setAttr(f'{delta_mush_deformer}.displacement', 0)
     else:
-        delta_mush_deformer = mc.deltaMush(geo, name = '{}_{}'.format(geo, name_suffix), si=iteration_value)[0]
+        delta_mush_deformer = mc.deltaMush(geo, name=f'{geo}_superDelta', si=iteration_value)[0]
 
     return delta_mush_deformer
 
 def texture_deformer(geo, vtx, offset, strength_value, name):
-    name_suffix = 'texDef'
-
-    tex_def, handle = mc.textureDeformer(geo, n='{}_{}'.format(name, name_suffix), en=1, s=strength_value, d="Normal", pointSpace="UV", o=offset)
-    mc.setAttr("{}.texture".format(tex_def), 1,1,1, type='double3')
-    mc.setAttr('{}.hiddenInOutliner'.format(handle), True)
+    tex_def, handle = mc.textureDeformer(geo, n=f'{name}_texDef', en=1, s=strength_value, d="Normal", pointSpace="UV", o=offset)
+    mc.setAttr(f'{tex_def}.texture', 1,1,1, type='double3')
+    mc.setAttr(f'{handle}.hiddenInOutliner', True)
 
-    return tex_def
\ No newline at end of file
+    return tex_def
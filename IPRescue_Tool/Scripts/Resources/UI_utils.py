@@ -7,6 +7,10 @@ Description:
 This module provides utility classes and functions for creating and managing UI components using PySide2. 
 It includes classes for sliders, checkboxes, combo boxes, line edits, drop-down menus, and dynamic menu bars.
 
+Functions:
+----------
+- standard_icon(sp_enum): Returns a standard QStyle icon, cached for the whole session.
+
 Classes:
 --------
 - Sliders: A class for creating slider widgets with associated labels and text fields.
@@ -25,7 +29,7 @@ Modules:
 Usage:
 ------
 Import this module and use the provided classes to create and manage UI components:
-    from Resources.UI_utils import Sliders, CheckBox, ComboBox, LineEditNum, DropMenu, DynamicMenuBar
+    from Resources.UI_utils import standard_icon, Sliders, CheckBox, ComboBox, LineEditNum, DropMenu, DynamicMenuBar
 
 Author:
 -------
@@ -36,13 +40,68 @@ Date:
 March 5, 2025
 """
 
+import functools
+import re
+
 from PySide2 import QtCore, QtWidgets, QtGui
 
+# Stylesheets used by the widgets, shared so they are not rebuilt on every change
+# Values that differ from the default are shown in bold through the "modified" dynamic property
+_LABEL_QSS = 'QLabel {font-size: 12px;} QLabel[modified="true"] {font-weight: bold;}'
+_CHECK_BOX_QSS = 'QCheckBox[modified="true"] {font-weight: bold;}'
+_COMBO_BOX_QSS = 'QComboBox[modified="true"] {font-weight: bold;}'
+_NUM_EDIT_QSS = 'background-color: rgb(54,54,54); font-size: 11px;'
+
+# Complete numbers only, partial input like '', '-' or '.' is left alone
+_NUMBER_RE = re.compile(r'^-?(\d+\.?\d*|\.\d+)$')
+
+# Layout values shared by the widgets
+_ALIGN_RIGHT_CENTER = QtCore.Qt.AlignRight | QtCore.Qt.AlignCenter
+_NO_MARGINS = QtCore.QMargins(0, 0, 0, 0)
+
+@functools.lru_cache(maxsize=None)
+def standard_icon(sp_enum):
+    ''' Return the standard QStyle icon, rasterized once and shared by every widget.'''
+    return QtWidgets.QApplication.style().standardIcon(sp_enum)
+
+def _sanitize(name):
+    ''' Turn an action name into an attribute name: lower case, spaces and hyphens as underscores.'''
+    return re.sub(r'[\s\-]+', '_', name.strip()).lower()
+
+# Validators are shared by every widget with the same range, keyed by (min, max, decimal)
+_VALIDATOR_CACHE = {}
+
+def _get_validator(vmin, vmax, decimal):
+    key = (vmin, vmax, decimal)
+    if key not in _VALIDATOR_CACHE:
+        if decimal == 0:
+            _VALIDATOR_CACHE[key] = QtGui.QIntValidator(vmin, vmax)
+        elif decimal > 0:
+            _VALIDATOR_CACHE[key] = QtGui.QDoubleValidator(vmin, vmax, decimal)
+        else:
+            raise TypeError('Number not supported')
+
+    return _VALIDATOR_CACHE[key]
+
+def _set_modified(owner, widget, modified):
+    ''' Toggle the "modified" property and re-polish the widget, only when owner's state actually flips.
+    owner is the widget instance holding the state, it must define a boolean _modified attribute.'''
+    if modified is owner._modified:
+        return
+    owner._modified = modified
+    widget.setProperty('modified', modified)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
 class Sliders(QtWidgets.QDialog):
 
     def __init__(self, name, value={'min':1, 'max':100, 'decimal': 0, 'default':10, 'interval':1}, parent=None):
         super(Sliders, self).__init__(parent)
 
+        self._modified = False
+        self._convert = int if value['decimal'] == 0 else float
+        self._last_value = value['default']
+
         self.slider_group(name, value)
         self.create_layout()
         self.create_connections()
@@ -50,25 +109,16 @@ class Sliders(QtWidgets.QDialog):
 
     def slider_group(self, name, value):
 
-        if value['decimal'] == 0:
-            validator = QtGui.QIntValidator(value['min'],value['max'], self)
-        elif value['decimal'] > 0:
-            validator = QtGui.QDoubleValidator(value['min'],value['max'], value['decimal'], self)
-        else:
-            raise TypeError('Number not supported')
+        validator = _get_validator(value['min'], value['max'], value['decimal'])
 
         #Label Name        
-        self.label = QtWidgets.QLabel('{}    '.format(name))
-        self.label.setStyleSheet(
-            'font-size: 12px;'
-        )
-        self.label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignCenter)
+        self.label = QtWidgets.QLabel(f'{name}    ')
+        self.label.setStyleSheet(_LABEL_QSS)
+        self.label.setAlignment(_ALIGN_RIGHT_CENTER)
 
         #Number Edit
         self.num_text = QtWidgets.QLineEdit()
-        self.num_text.setStyleSheet(
-        'background-color: rgb(54,54,54);'
-        'font-size: 11px;')
+        self.num_text.setStyleSheet(_NUM_EDIT_QSS)
         self.num_text.setFixedWidth(80)
         self.num_text.setFixedHeight(25)
         self.num_text.setText(str(value['default']))
@@ -84,8 +134,19 @@ class Sliders(QtWidgets.QDialog):
 
     def value_text(self):
         self.txt_value = self.num_text.text()
+        if not _NUMBER_RE.match(self.txt_value):
+            return self._last_value
+
+        return self._convert(self.txt_value)
+
+    def value(self):
+        ''' Return the current value as a number, without reading the text field.'''
+        return self._last_value
 
-        return float(self.txt_value)
+    @QtCore.Slot(str)
+    def cache_value(self, txt_value):
+        if _NUMBER_RE.match(txt_value):
+            self._last_value = self._convert(txt_value)
         
     def create_layout(self):
         iterations_lay = QtWidgets.QHBoxLayout(self)
@@ -93,40 +154,67 @@ class Sliders(QtWidgets.QDialog):
         iterations_lay.addWidget(self.num_text, QtCore.Qt.AlignRight)
         iterations_lay.addWidget(self.slider, QtCore.Qt.AlignRight)
 
-        iterations_lay.setContentsMargins(0, 0, 0, 0)
+        iterations_lay.setContentsMargins(_NO_MARGINS)
 
     def create_connections(self):
-        self.slider.valueChanged.connect(self.print_txt)
-        self.num_text.textEdited.connect(self.change_slider)
-        self.num_text.textEdited.connect(self.change_label_font)
-        self.slider.valueChanged.connect(self.change_label_font)
+        # Fast typing is collapsed into one slider update per frame
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self.change_slider)
+
+        self.slider.valueChanged.connect(self._on_slider_changed)
+        self.num_text.textEdited.connect(self._on_text_edited)
+        self.num_text.textChanged.connect(self.cache_value)
+        self.num_text.editingFinished.connect(self.change_label_font)
+
+    @QtCore.Slot(int)
+    def _on_slider_changed(self, slider_value):
+        self.print_txt()
+        self.change_label_font()
+
+    @QtCore.Slot(str)
+    def _on_text_edited(self, txt_value):
+        # Label font waits for editingFinished
+        self._update_timer.start()
 
     def print_txt(self):
         sliderValue = self.slider.value()
+
+        # Blocked so the text update does not come back through the text signals
+        blocker = QtCore.QSignalBlocker(self.num_text)
         self.num_text.setText(str(sliderValue))
+        blocker.unblock()
+        self.cache_value(self.num_text.text())
 
     def change_slider(self):
         txt_value = self.num_text.text()
-        self.slider.setValue(float(txt_value))
+        if not _NUMBER_RE.match(txt_value):
+            return
+
+        number = self._convert(txt_value)
 
+        # Blocked so the slider does not rewrite the text being typed
+        blocker = QtCore.QSignalBlocker(self.slider)
+        self.slider.setValue(number)
+        blocker.unblock()
+
+        # The slider clamped an out of range value, show and cache the clamped one
+        if number < self.slider.minimum() or number > self.slider.maximum():
+            self.print_txt()
+
+    @QtCore.Slot()
     def change_label_font(self):
         txt_value = self.value_text()
-
-        if txt_value != self.def_value:
-            self.label.setStyleSheet(
-                'font-size: 11px;'
-                'font-weight: bold;'
-            )
-        else:
-            self.label.setStyleSheet(
-                'font-size: 11px;'
-            )
+        _set_modified(self, self.label, txt_value != self.def_value)
 
 class CheckBox(QtWidgets.QDialog):
 
     def __init__(self, name, status=False, parent=None):
         super(CheckBox, self).__init__(parent)
 
+        self._modified = False
+
         self.check_box(name, status)
         self.create_layout()
         self.init_state = status
@@ -134,33 +222,31 @@ class CheckBox(QtWidgets.QDialog):
 
     def check_box(self, name, status):
         self.check_box = QtWidgets.QCheckBox(name)
+        self.check_box.setStyleSheet(_CHECK_BOX_QSS)
         
         if status == True:
             self.check_box.setChecked(True)
 
     def create_layout(self):
-        check_lay = QtWidgets.QGridLayout(self)
+        check_lay = QtWidgets.QHBoxLayout(self)
         check_lay.addWidget(self.check_box)
 
-        check_lay.setContentsMargins(0, 0, 0, 0)
+        check_lay.setContentsMargins(_NO_MARGINS)
     
     def create_connections(self):
-        self.check_box.stateChanged.connect(self.status_check)
-        self.check_box.stateChanged.connect(self.change_font)
+        self.check_box.stateChanged.connect(self._on_state_changed)
+
+    @QtCore.Slot(int)
+    def _on_state_changed(self, state):
+        # change_font reads the status itself
+        self.change_font()
 
     def status_check(self):
         self.check_status = self.check_box.isChecked()
         return self.check_status
 
     def change_font(self):
-        if self.status_check() != self.init_state:
-            self.check_box.setStyleSheet(
-                'font-weight: bold;'
-            )
-        else:
-            self.check_box.setStyleSheet(
-                'font-weight: normal;'
-            )
+        _set_modified(self, self.check_box, self.status_check() != self.init_state)
 
 class ComboBox(QtWidgets.QDialog):
     
@@ -168,6 +254,8 @@ class ComboBox(QtWidgets.QDialog):
                                 2: 'item_2'}, default=0, parent=None):
         super(ComboBox, self).__init__(parent)
 
+        self._modified = False
+
         self.create_widgets(items, default)
         self.create_layout()
         self.def_item = default
@@ -175,6 +263,7 @@ class ComboBox(QtWidgets.QDialog):
 
     def create_widgets(self, items, default):
         self.box = QtWidgets.QComboBox()
+        self.box.setStyleSheet(_COMBO_BOX_QSS)
 
         if len(items) < 2:
             raise TypeError("Not Enough items")
@@ -192,11 +281,15 @@ class ComboBox(QtWidgets.QDialog):
         combo_lay = QtWidgets.QVBoxLayout(self)
         combo_lay.addWidget(self.box)
 
-        combo_lay.setContentsMargins(0, 0, 0, 0)
+        combo_lay.setContentsMargins(_NO_MARGINS)
 
     def create_connections(self):
-        self.box.currentIndexChanged.connect(self.selected_item)
-        self.box.currentIndexChanged.connect(self.change_font)
+        self.box.currentIndexChanged.connect(self._on_index_changed)
+
+    @QtCore.Slot(int)
+    def _on_index_changed(self, index):
+        # change_font reads the selected item itself
+        self.change_font()
 
     def signal(self):
         return self.box
@@ -206,19 +299,15 @@ class ComboBox(QtWidgets.QDialog):
         return self.item
 
     def change_font(self):
-        if self.selected_item() != self.def_item:
-            self.box.setStyleSheet(
-                'font-weight: bold;'
-            )
-        else:
-            self.box.setStyleSheet(
-                'font-weight: normal;'
-            )
+        _set_modified(self, self.box, self.selected_item() != self.def_item)
 
 class LineEditNum(QtWidgets.QDialog):
     def __init__(self, name, value={'min': 0, 'max': 10, 'decimal': 0, 'default': 1}, parent=None):
         super(LineEditNum, self).__init__(parent)
 
+        self._modified = False
+        self._convert = int if value['decimal'] == 0 else float
+
         self.create_widgets(name, value)
         self.create_layout()
         self.create_connections()
@@ -226,25 +315,16 @@ class LineEditNum(QtWidgets.QDialog):
         self.def_value = value['default']
 
     def create_widgets(self, name, value):
-        if value['decimal'] == 0:
-            validator = QtGui.QIntValidator(value['min'],value['max'], self)
-        elif value['decimal'] > 0:
-            validator = QtGui.QDoubleValidator(value['min'],value['max'], value['decimal'], self)
-        else:
-            raise TypeError('Number not supported')
+        validator = _get_validator(value['min'], value['max'], value['decimal'])
 
         #Label Name        
-        self.label = QtWidgets.QLabel('{}: '.format(name))
-        self.label.setStyleSheet(
-            'font-size: 12px;'
-        )
-        self.label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignCenter)
+        self.label = QtWidgets.QLabel(f'{name}: ')
+        self.label.setStyleSheet(_LABEL_QSS)
+        self.label.setAlignment(_ALIGN_RIGHT_CENTER)
 
         #Number Edit
         self.line_edit = QtWidgets.QLineEdit()
-        self.line_edit.setStyleSheet(
-        'background-color: rgb(54,54,54);'
-        'font-size: 11px;')
+        self.line_edit.setStyleSheet(_NUM_EDIT_QSS)
         self.line_edit.setFixedWidth(40)
         self.line_edit.setFixedHeight(25)
         self.line_edit.setText(str(value['default']))
@@ -256,30 +336,34 @@ class LineEditNum(QtWidgets.QDialog):
         line_edit_lay.addWidget(self.line_edit)
         line_edit_lay.addStretch()
 
-        line_edit_lay.setContentsMargins(0, 0, 0, 0)
+        line_edit_lay.setContentsMargins(_NO_MARGINS)
 
     def create_connections(self):
-        self.line_edit.textEdited.connect(self.text_number)
-        self.line_edit.textEdited.connect(self.change_label_font)
+        # Label font is only updated once the edit is done, not per keystroke
+        self.line_edit.editingFinished.connect(self.change_label_font)
 
     def text_number(self):
         self.txt_value = self.line_edit.text()
-        return float(self.txt_value)
+        if not _NUMBER_RE.match(self.txt_value):
+            return None
+
+        return self._convert(self.txt_value)
         
+    @QtCore.Slot()
     def change_label_font(self):
         txt_value = self.text_number()
+        if txt_value is None:
+            return
 
-        if txt_value != self.def_value:
-            self.label.setStyleSheet(
-                'font-size: 11px;'
-                'font-weight: bold;'
-            )
-        else:
-            self.label.setStyleSheet(
-                'font-size: 11px;'
-            )
+        _set_modified(self, self.label, txt_value != self.def_value)
 
 class DropMenu(QtWidgets.QDialog):
+    # Button stylesheets, shared by every drop-down
+    _OPEN_QSS = ('QPushButton {text-align: left; font-weight: bold; font-size: 12px; border-radius: 5px; background-color: rgb(110, 110, 110);}'
+                 'QPushButton:hover {background-color: rgb(120, 120, 120);}')
+    _CLOSE_QSS = ('QPushButton {text-align: left; font-size: 12px; border-radius: 5px; background-color: rgb(90, 90, 90);}'
+                  'QPushButton:hover {background-color: rgb(100, 100, 100);}')
+
     def __init__(self, name, image = {'open': None,
                                       'close': None}, default='open', parent=None):
         super(DropMenu, self).__init__(parent)
@@ -320,39 +404,22 @@ class DropMenu(QtWidgets.QDialog):
         drop_lay.addWidget(self.open_btn)
         drop_lay.addWidget(self.close_btn)
 
-        drop_lay.setContentsMargins(0, 0, 0, 0)
+        drop_lay.setContentsMargins(_NO_MARGINS)
 
     def btn_images(self):
         #Arrow pictures
         self.arrow_up = QtWidgets.QStyle.SP_TitleBarShadeButton
         self.arrow_down = QtWidgets.QStyle.SP_TitleBarUnshadeButton
-        self.image_down = self.style().standardIcon(self.arrow_up)  
-        self.image_up = self.style().standardIcon(self.arrow_down)
+        self.image_down = standard_icon(self.arrow_up)
+        self.image_up = standard_icon(self.arrow_down)
 
     def btn_open_style(self, btn, image):
         btn.setIcon(image)
-        btn.setStyleSheet(
-            'QPushButton {text-align: left;'
-            'font-weight: bold;'
-            'font-size: 12px;'
-            'border-radius: 5px;'
-            'background-color: rgb(110, 110, 110);}'
-
-            'QPushButton:hover {'
-            'background-color: rgb(120, 120, 120);}'
-        )
+        btn.setStyleSheet(self._OPEN_QSS)
 
     def btn_close_style(self, btn, image):
         btn.setIcon(image)
-        btn.setStyleSheet(
-            'QPushButton {text-align: left;'
-            'font-size: 12px;'
-            'border-radius: 5px;'
-            'background-color: rgb(90, 90, 90);}'
-
-            'QPushButton:hover {'
-            'background-color: rgb(100, 100, 100);}'
-        )   
+        btn.setStyleSheet(self._CLOSE_QSS)
 
     def create_connections(self):
         self.open_btn.clicked.connect(self.hide_element)
@@ -381,21 +448,27 @@ class DynamicMenuBar(QtWidgets.QDialog):
         self.menu_bar = QtWidgets.QMenuBar()
         self.menu_bar.setMinimumHeight(25)
 
+        # Bound once, outside the loops
+        add_menu = self.menu_bar.addMenu
+        QAction = QtWidgets.QAction
+        actions = self.actions
+
         for key, value in items.items():
-            menu = self.menu_bar.addMenu(key)
+            add_action = add_menu(key).addAction
             for action_name in value:
-                action = QtWidgets.QAction(action_name, self)
-                menu.addAction(action)
-                self.actions[action_name] = action
+                action = QAction(action_name, self)
+                add_action(action)
+                actions[action_name] = action
+
+                # Also reachable as an attribute, e.g. 'File Open' -> self.file_open
+                attr_name = _sanitize(action_name)
+                if not hasattr(self, attr_name):
+                    setattr(self, attr_name, action)
 
     def create_layout(self):
         layout = QtWidgets.QVBoxLayout(self)
         layout.setMenuBar(self.menu_bar)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setContentsMargins(_NO_MARGINS)
 
     def get_action(self, action_name):
         return self.actions.get(action_name)
-
-if __name__ == '__main__':
-    ui = DynamicMenuBar()
-    ui.show()
\ No newline at end of file
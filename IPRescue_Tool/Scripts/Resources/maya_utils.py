@@ -9,7 +9,8 @@ It includes functions to get the Maya main window and delete workspace controls.
 
 Functions:
 ----------
-- get_maya_main_window(instance): Returns the Maya main window as a PySide2 QWidget instance.
+- get_maya_main_window(instance): Returns the Maya main window as a PySide2 QWidget instance, cached per class.
+  get_maya_main_window.cache_clear() forgets the cached wrappers.
 - delete_workspace_control(ctrl): Deletes the specified workspace control if it exists.
 
 Modules:
@@ -37,20 +38,35 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Maya main window wrappers, keyed by the requested class
+_MAIN_WINDOW_CACHE = {}
+
 def get_maya_main_window(instance):
-    ''' Return Maya main window as a PySide2 QWidget instance.'''
+    ''' Return Maya main window as a PySide2 QWidget instance, wrapped once per class for the session.'''
+    if instance in _MAIN_WINDOW_CACHE:
+        return _MAIN_WINDOW_CACHE[instance]
+
     try:
         main_window_ptr = omui.MQtUtil.mainWindow()
-        return wrapInstance(int(main_window_ptr), instance)
+        main_window = wrapInstance(int(main_window_ptr), instance)
     except Exception as e:
-        logger.error('Error getting Maya main window: {}'.format(e))
+        logger.error('Error getting Maya main window: %s', e)
         return None
 
+    _MAIN_WINDOW_CACHE[instance] = main_window
+    return main_window
+
+# Lets a reload drop the cached wrappers
+get_maya_main_window.cache_clear = _MAIN_WINDOW_CACHE.clear
+
 def delete_workspace_control(ctrl):
     try:
-        if mc.workspaceControl(ctrl, q=True, exists=True):
-            mc.workspaceControl(ctrl, e=True, close=True)
-            mc.deleteUI(ctrl, control=True)
-        logger.info('Workspace control {} deleted successfully.'.format(ctrl))
+        # Usual case on a first open, nothing to delete
+        if not mc.control(ctrl, exists=True):
+            return
+
+        mc.workspaceControl(ctrl, e=True, close=True)
+        mc.deleteUI(ctrl, control=True)
+        logger.info('Workspace control %s deleted successfully.', ctrl)
     except Exception as e:
-        logger.error('Error deleting workspace control: {}'.format(e))
\ No newline at end of file
+        logger.error('Error deleting workspace control: %s', e)
\ No newline at end of file
@@ -28,15 +28,16 @@ import traceback
 import sys
 import os
 
-# Add the Scripts directory to the sys.path
-scripts_dir = os.path.join(os.path.dirname(__file__), 'Scripts')
-if scripts_dir not in sys.path:
+# Add the Scripts directory to the sys.path, once and only if it is there
+scripts_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Scripts'))
+if os.path.isdir(scripts_dir) and scripts_dir not in sys.path:
     sys.path.append(scripts_dir)
 
-import IPRescue_UI as IPRescue_UI
-
 def open_IPRescue_ui():
     try:
+        # Imported here so the shelf button only pays for the UI when it is clicked
+        import IPRescue_UI
+
         mainUi = IPRescue_UI.ToolsUI()
         mainUi.show(dockable=True)
     except Exception as e: